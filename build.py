@@ -1,4 +1,37 @@
-from distutils.core import Extension
+import os
+from typing import List
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+
+# -march=native produces binaries that may not run on other machines, so it
+# must not be used for distributed wheels
+NATIVE = os.environ.get("MECH3AX_NATIVE") == "1"
+
+
+def _compile_args(compiler_type: str) -> List[str]:
+    # -ffast-math and floating-point contraction (FMA) must not be used, since
+    # the float helpers have to produce the exact same results as the engine
+    if compiler_type == "msvc":
+        args = ["/O2", "/fp:precise"]
+        if NATIVE:
+            args.append("/arch:AVX2")
+    else:
+        args = ["-O3", "-funroll-loops", "-ffp-contract=off"]
+        if NATIVE:
+            args.append("-march=native")
+    return args
+
+
+class BuildExt(build_ext):
+    # the flags depend on the compiler actually used (e.g. via CC or
+    # --compiler), which is only known once the build has started
+    def build_extensions(self) -> None:
+        args = _compile_args(self.compiler.compiler_type)
+        for ext in self.extensions:
+            ext.extra_compile_args = args
+        super().build_extensions()
+
 
 color_speedup = Extension(
     "mech3ax.parse.colors._native", ["src/mech3ax/parse/colors/native.c"], language="c",
@@ -11,3 +44,4 @@ float_helpers = Extension(
 
 def build(setup_kwargs):
     setup_kwargs["ext_modules"] = [color_speedup, float_helpers]
+    setup_kwargs["cmdclass"] = {"build_ext": BuildExt}
@@ -1,46 +1,49 @@
 # Blender is probably not installed in the linting environment,
-# so importing bpy and bmesh will fail
+# so importing bpy will fail
 # pylint: disable=import-error
 import argparse
 import json
+import shutil
 import sys
+from array import array
+from contextlib import nullcontext
+from itertools import chain
 from math import radians
 from pathlib import Path
 from zipfile import ZipFile
 
-import bmesh
 import bpy
+import numpy as np
+
+try:
+    # not bundled with Blender, but much faster for large models
+    import orjson
+except ImportError:
+    orjson = None
+
+COPY_BUFSIZE = 1024 * 1024
+# hack to convert Y-up models to Blender's coordinate system
+Y_UP_ROTATION = (radians(90), 0.0, radians(180))
+CAMERA_ROTATION = (radians(80), 0.0, 0.0)
 
 
 def _process_mesh(name, mesh_data, material_factory):  # pylint: disable=too-many-locals
     mesh = bpy.data.meshes.new(name=name)
     obj = bpy.data.objects.new(name, mesh)
 
-    vertices = mesh_data["vertices"]
+    # positions, UVs and material indices are kept in separate, flat arrays
+    # that can be handed to Blender directly
+    vertices = np.asarray(mesh_data["vertices"], dtype=np.float32).reshape(-1, 3)
     # skipped: normals
     polygons = mesh_data["polygons"]
 
-    textures = set()
-    for poly in polygons:
-        textures.add(poly["texture_index"])
-
+    # materials are added in the order the textures are first used
     tex_index_to_mat_index = {}
-    for material_index, texture_index in enumerate(textures):
-        mat = material_factory(texture_index)
-        obj.data.materials.append(mat)
-        tex_index_to_mat_index[texture_index] = material_index
-
-    # it may be possible to do this with a normal Mesh object, similar
-    # to Blender's import_obj.py add-on. But this works.
-    bm = bmesh.new()
-    for vert in vertices:
-        bm.verts.new(vert)
-
-    bm.verts.ensure_lookup_table()
-    bm.verts.index_update()
-
-    uv_layer = bm.loops.layers.uv.new()
 
+    faces = []
+    material_indices = array("i")
+    uv_chunks = []
+    seen = set()
     for poly in polygons:
         vertex_indices = poly["vertex_indices"]
         # skipped: vertex_colors
@@ -48,63 +51,113 @@ def _process_mesh(name, mesh_data, material_factory):  # pylint: disable=too-man
         uvs = poly["uv_coords"]
         texture_index = poly["texture_index"]
 
-        try:
-            face = bm.faces.new(bm.verts[i] for i in vertex_indices)
-        except ValueError as e:
-            # some models contain duplicate faces. they are identical, so
-            # skipping them seems harmless
-            print("Mesh", name, "error:", str(e), "ptr:", poly["vertex_ptr"])
+        # reject the same faces bmesh would: some models contain duplicate
+        # faces. they are identical, so skipping them seems harmless
+        key = tuple(sorted(vertex_indices))
+        unique_count = len(set(key))
+        if unique_count < 3 or unique_count != len(key) or key in seen:
+            print("Mesh", name, "error: invalid face", "ptr:", poly["vertex_ptr"])
             continue
+        seen.add(key)
+
+        material_index = tex_index_to_mat_index.get(texture_index)
+        if material_index is None:
+            material_index = len(tex_index_to_mat_index)
+            tex_index_to_mat_index[texture_index] = material_index
+            obj.data.materials.append(material_factory(texture_index))
+
+        faces.append(vertex_indices)
+        material_indices.append(material_index)
+
+        # loops are created in face order, so the UVs must be too. there must
+        # be exactly one per loop, so as with zip, extra UVs are ignored and
+        # missing UVs are zero
+        loop_total = len(vertex_indices)
+        if len(uvs) != loop_total:
+            uvs = (list(uvs) + [(0.0, 0.0)] * loop_total)[:loop_total]
+        uv_chunks.append(uvs)
+
+    loop_totals = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+    loop_starts = np.zeros_like(loop_totals)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    loop_count = int(loop_totals.sum())
+    vertex_indices = np.fromiter(
+        chain.from_iterable(faces), dtype=np.int32, count=loop_count
+    )
 
-        face.material_index = tex_index_to_mat_index[texture_index]
-
-        if uvs:
-            # because all our faces are created as loops, this should work
-            for index_in_mesh, loop, uv in zip(vertex_indices, face.loops, uvs):
-                assert loop.vert.index == index_in_mesh
-                loop[uv_layer].uv = uv
+    # this is what Mesh.from_pydata does, but without converting to lists
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.loops.add(loop_count)
+    mesh.loops.foreach_set("vertex_index", vertex_indices)
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        # read-only since 4.0, where it is derived from the loop starts
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.polygons.foreach_set("material_index", material_indices)
+
+    uv_coords = np.fromiter(
+        chain.from_iterable(chain.from_iterable(uv_chunks)),
+        dtype=np.float32,
+        count=loop_count * 2,
+    )
+    uv_layer = mesh.uv_layers.new()
+    uv_layer.data.foreach_set("uv", uv_coords)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    # unlike bmesh, nothing has checked the geometry (e.g. vertex indices)
+    mesh.validate()
+    mesh.update()
 
     return obj
 
 
-def _process_node(node, parent, material_factory):
-    name = node["name"]
-    object3d = node["object3d"]
-    mesh_data = node["mesh"]
-    children = node["children"]
-    translation = object3d["translation"]
-    rotation = object3d["rotation"]
-
-    if not mesh_data:
-        obj = bpy.data.objects.new(name, None)  # empty
-    else:
-        obj = _process_mesh(name, mesh_data, material_factory)
+def _process_nodes(root_node, material_factory):
+    # bind these once, instead of looking them up for every node
+    objects_new = bpy.data.objects.new
+    link = bpy.context.collection.objects.link
+
+    root_obj = None
+    # iterate instead of recursing, so deep trees can't hit the recursion limit
+    stack = [(root_node, None)]
+    while stack:
+        node, parent = stack.pop()
+        name = node["name"]
+        object3d = node["object3d"]
+        mesh_data = node["mesh"]
+        children = node["children"]
+        translation = object3d["translation"]
+        rotation = object3d["rotation"]
+
+        if not mesh_data:
+            obj = objects_new(name, None)  # empty
+        else:
+            obj = _process_mesh(name, mesh_data, material_factory)
 
-    obj.location = translation if translation else (0.0, 0.0, 0.0)
-    obj.rotation_euler = rotation if rotation else (0.0, 0.0, 0.0)
+        obj.location = translation if translation else (0.0, 0.0, 0.0)
+        obj.rotation_euler = rotation if rotation else (0.0, 0.0, 0.0)
 
-    bpy.context.collection.objects.link(obj)
+        link(obj)
 
-    if parent:
-        obj.parent = parent
+        if parent:
+            obj.parent = parent
+        else:
+            root_obj = obj
 
-    for child in children:
-        _process_node(child, obj, material_factory)
+        # move the "head" object to a different layer
+        if name == "head":
+            collection = bpy.context.scene.collection
+            head = bpy.data.collections.new("head")
+            collection.children.link(head)
+            head.objects.link(obj)
+            collection.objects.unlink(obj)
+            head.hide_viewport = True
+            head.hide_render = True
 
-    # move the "head" object to a different layer
-    if name == "head":
-        collection = bpy.context.scene.collection
-        head = bpy.data.collections.new("head")
-        collection.children.link(head)
-        head.objects.link(obj)
-        collection.objects.unlink(obj)
-        head.hide_viewport = True
-        head.hide_render = True
+        # reversed, so the children are still created in order
+        stack.extend((child, obj) for child in reversed(children))
 
-    return obj
+    return root_obj
 
 
 def _add_camera():
@@ -113,7 +166,7 @@ def _add_camera():
 
     camera_obj = bpy.data.objects.new("Camera", camera)
     camera_obj.location = (0.0, -60.0, 8.0)
-    camera_obj.rotation_euler = (radians(80), 0.0, 0.0)
+    camera_obj.rotation_euler = CAMERA_ROTATION
 
     bpy.context.scene.collection.objects.link(camera_obj)
     bpy.context.scene.camera = camera_obj
@@ -126,8 +179,30 @@ def _set_shading():
                 space.shading.type = "MATERIAL"
 
 
-def _create_anim(anim):
-    objects = dict(bpy.data.objects.items())
+def _add_fcurves(action, data_path, values, group):
+    values = np.asarray(values, dtype=np.float32)
+
+    # only insert keyframes for frames that are different from the previous one
+    changed = np.empty(len(values), dtype=bool)
+    changed[0] = True
+    np.any(values[1:] != values[:-1], axis=1, out=changed[1:])
+    keyframes = values[changed]
+
+    # interleaved (frame, value) pairs
+    co = np.empty((len(keyframes), 2), dtype=np.float32)
+    co[:, 0] = np.flatnonzero(changed) + 1
+
+    for index in range(values.shape[1]):
+        co[:, 1] = keyframes[:, index]
+
+        fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+        fcurve.keyframe_points.add(len(co))
+        fcurve.keyframe_points.foreach_set("co", co.ravel())
+        fcurve.update()
+
+
+def _create_anim(anim, name):
+    objects_get = bpy.data.objects.get
     frames = anim["frames"]
 
     scene = bpy.context.scene
@@ -135,45 +210,33 @@ def _create_anim(anim):
     scene.frame_end = frames
 
     for obj_name, anim_data in anim["parts"].items():
-        try:
-            obj = objects[obj_name]
-        except KeyError:
+        obj = objects_get(obj_name)
+        if obj is None:
             print("Unknown anim object", obj_name)
             continue
 
-        # prime the animation with the first keyframe
-        prev_loc, prev_rot = anim_data[0]
-
-        obj.location = prev_loc
-        obj.keyframe_insert(data_path="location", frame=1)
-
         obj.rotation_mode = "QUATERNION"
-        obj.rotation_quaternion = prev_rot
-        obj.keyframe_insert(data_path="rotation_quaternion", frame=1)
 
-        # step through the next frames. if they're the same, don't insert
-        for frame, (next_loc, next_rot) in enumerate(anim_data[1:], 2):
-            if next_loc != prev_loc:
-                obj.location = next_loc
-                obj.keyframe_insert(data_path="location", frame=frame)
-                prev_loc = next_loc
+        # creating the keyframes in bulk is much faster than keyframe_insert
+        action = bpy.data.actions.new(f"{name}_{obj_name}")
+        obj.animation_data_create()
+        obj.animation_data.action = action
 
-            if next_rot != prev_rot:
-                obj.rotation_quaternion = next_rot
-                obj.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-                prev_rot = next_rot
+        locations = [loc for loc, _ in anim_data]
+        rotations = [rot for _, rot in anim_data]
+        _add_fcurves(action, "location", locations, obj_name)
+        _add_fcurves(action, "rotation_quaternion", rotations, obj_name)
 
 
 def model_to_blend(root_node, material_factory, name, anim):
     # empty scene
     bpy.ops.wm.read_factory_settings(use_empty=True)
 
-    root_obj = _process_node(root_node, None, material_factory)
-    # hack to convert Y-up model to Blender's coordinate system
-    root_obj.rotation_euler = (radians(90), radians(0), radians(180))
+    root_obj = _process_nodes(root_node, material_factory)
+    root_obj.rotation_euler = Y_UP_ROTATION
 
     if anim:
-        _create_anim(anim)
+        _create_anim(anim, name)
 
     _add_camera()
     _set_shading()
@@ -182,11 +245,32 @@ def model_to_blend(root_node, material_factory, name, anim):
     bpy.ops.wm.save_as_mainfile(filepath=f"{name}.blend")
 
 
+def _load_image(filename):
+    image = bpy.data.images.get(filename)
+    if image is None:
+        image = bpy.data.images.load(f"//{filename}")
+    return image
+
+
 class MaterialFactory:
     def __init__(self, mechtex, materials):
-        self.mechtex = ZipFile(mechtex) if mechtex else None
+        self.mechtex = mechtex
         self.materials = materials
         self.cache = {}
+        self.textures = {}
+
+    def _extract_texture(self, material_name):
+        # only extract each texture once
+        try:
+            return self.textures[material_name]
+        except KeyError:
+            pass
+
+        filename = f"{material_name}.png"
+        with self.mechtex.open(filename) as src, open(filename, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+        self.textures[material_name] = filename
+        return filename
 
     def __call__(self, texture_index):
         try:
@@ -200,36 +284,54 @@ class MaterialFactory:
             material_name = material_info["name"]
         except KeyError:
             # untextured
-            mat = bpy.data.materials.new(f"material_{texture_index}")
-            mat.use_nodes = True
-
-            try:
-                red = material_info["red"] / 255.0
-                green = material_info["green"] / 255.0
-                blue = material_info["blue"] / 255.0
-            except KeyError:
-                pass
-            else:
-                bsdf = mat.node_tree.nodes["Principled BSDF"]
-                bsdf.inputs[0].default_value = (red, green, blue, 1)
+            material_name = f"material_{texture_index}"
+            mat = bpy.data.materials.get(material_name)
+            if mat is None:
+                mat = bpy.data.materials.new(material_name)
+                mat.use_nodes = True
+
+                try:
+                    red = material_info["red"] / 255.0
+                    green = material_info["green"] / 255.0
+                    blue = material_info["blue"] / 255.0
+                except KeyError:
+                    pass
+                else:
+                    bsdf = mat.node_tree.nodes["Principled BSDF"]
+                    bsdf.inputs[0].default_value = (red, green, blue, 1)
         else:
-            mat = bpy.data.materials.new(material_name)
-            mat.use_nodes = True
-            bsdf = mat.node_tree.nodes["Principled BSDF"]
+            mat = bpy.data.materials.get(material_name)
+            if mat is None:
+                mat = bpy.data.materials.new(material_name)
+                mat.use_nodes = True
+                bsdf = mat.node_tree.nodes["Principled BSDF"]
 
-            if self.mechtex:
-                self.mechtex.extract(f"{material_name}.png")
-                image = bpy.data.images.load(f"//{material_name}.png")
+                if self.mechtex:
+                    filename = self._extract_texture(material_name)
+                    image = _load_image(filename)
 
-                tex = mat.node_tree.nodes.new("ShaderNodeTexImage")
-                tex.image = image
+                    tex = mat.node_tree.nodes.new("ShaderNodeTexImage")
+                    tex.image = image
 
-                mat.node_tree.links.new(bsdf.inputs["Base Color"], tex.outputs["Color"])
+                    mat.node_tree.links.new(
+                        bsdf.inputs["Base Color"], tex.outputs["Color"]
+                    )
 
         self.cache[texture_index] = mat
         return mat
 
 
+def _load_json(zipfile, name):
+    data = zipfile.read(name)
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson doesn't support NaN or Infinity
+            pass
+    return json.loads(data)
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="blender --background --factory-startup --python model2blend.py --",
@@ -275,23 +377,20 @@ def main():
     print(f"Converting '{args.model_name}' to '{name}.blend'")
 
     with ZipFile(mechlib) as zipfile:
-        with zipfile.open("materials.json", "r") as f:
-            materials = json.load(f)
-
-        mechfile = f"mech_{args.model_name}.json"
-        with zipfile.open(mechfile, "r") as f:
-            root_node = json.load(f)
+        materials = _load_json(zipfile, "materials.json")
+        root_node = _load_json(zipfile, f"mech_{args.model_name}.json")
 
     if args.anim:
         motion = (args.directory / "motion.zip").resolve(strict=True)
         with ZipFile(motion) as zipfile:
-            with zipfile.open(f"{name}.json", "r") as f:
-                anim = json.load(f)
+            anim = _load_json(zipfile, f"{name}.json")
     else:
         anim = None
 
-    material_factory = MaterialFactory(mechtex, materials)
-    model_to_blend(root_node, material_factory, name, anim)
+    # the textures are extracted while the model is converted
+    with ZipFile(mechtex) if mechtex else nullcontext() as mechtex_zip:
+        material_factory = MaterialFactory(mechtex_zip, materials)
+        model_to_blend(root_node, material_factory, name, anim)
 
 
 if __name__ == "__main__":
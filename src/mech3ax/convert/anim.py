@@ -4,25 +4,33 @@ The conversion is one-way only.
 """
 from argparse import Namespace, _SubParsersAction
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
 
 from ..parse.anim import read_anim
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    COMPRESS_LEVEL,
+    add_compress_level_arg,
+    dir_exists,
+    model_json,
+    output_resolve,
+    path_exists,
+    read_mapped,
+    zip_writer,
+)
 
 ANIM_METADATA = "metadata.json"
 
 
-def anim_zbd_to_zip(input_zbd: Path, output_zip: Path) -> None:
-    data = input_zbd.read_bytes()
+def anim_zbd_to_zip(
+    input_zbd: Path, output_zip: Path, compresslevel: int = COMPRESS_LEVEL
+) -> None:
+    data = read_mapped(input_zbd)
     anim_md, anim_defs = read_anim(data)
 
-    with ZipFile(output_zip, "w", compression=ZIP_DEFLATED, compresslevel=9) as z:
-        z.writestr(ANIM_METADATA, anim_md.json(indent=2))
+    with zip_writer(output_zip, compresslevel) as z:
+        z.writestr(ANIM_METADATA, model_json(anim_md))
 
         for anim_def in anim_defs:
-            z.writestr(
-                anim_def.file_name, anim_def.json(exclude_defaults=True, indent=2)
-            )
+            z.writestr(anim_def.file_name, model_json(anim_def, exclude_defaults=True))
 
 
 # def anim_json_to_zbd(input_json: Path, output_zbd: Path) -> None:
@@ -34,7 +42,7 @@ def anim_zbd_to_zip(input_zbd: Path, output_zip: Path) -> None:
 
 def anim_from_zbd_command(args: Namespace) -> None:
     output_zip = output_resolve(args.input_zbd, args.output_zip, ".zip")
-    anim_zbd_to_zip(args.input_zbd, output_zip)
+    anim_zbd_to_zip(args.input_zbd, output_zip, args.compress_level)
 
 
 def anim_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
@@ -42,6 +50,7 @@ def anim_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
     parser.set_defaults(command=anim_from_zbd_command)
     parser.add_argument("input_zbd", type=path_exists)
     parser.add_argument("output_zip", type=dir_exists, default=None, nargs="?")
+    add_compress_level_arg(parser)
 
 
 # def anim_to_zbd_command(args: Namespace) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import List, Optional, Set, cast
+from pathlib import PurePath
+from typing import Dict, List, Optional, Set, cast
 
 from pydantic import BaseModel
 
@@ -24,10 +24,12 @@ class ArchiveInfo(BaseModel):
     def from_entry(cls, entry: ArchiveEntry, rename: str) -> ArchiveInfo:
         comment_bytes: Optional[bytes] = None
         comment_ascii: Optional[str] = None
-        try:
-            # don't use ascii_zterm, this can contain garbage after zeros
-            comment_ascii = entry.comment.rstrip(b"\0").decode("ascii")
-        except UnicodeDecodeError:
+        # don't use ascii_zterm, this can contain garbage after zeros
+        comment = entry.comment.rstrip(b"\0")
+        # checking is cheaper than raising for binary comments, which are common
+        if comment.isascii():
+            comment_ascii = comment.decode("ascii")
+        else:
             comment_bytes = entry.comment
         return cls(
             name=entry.name,
@@ -67,13 +69,22 @@ class Renamer:
 
     def __init__(self) -> None:
         self._names: Set[str] = set()
+        # the next suffix to try for a duplicate name. names are never removed,
+        # so suffixes that were taken once don't have to be tried again
+        self._counts: Dict[str, int] = {}
 
     def __call__(self, name: str) -> str:
-        basename = Path(name)
-        i = 1
-        while name in self._names:
-            name = f"{basename.stem}_{i}{basename.suffix}"
+        if name not in self._names:
+            self._names.add(name)
+            return name
+
+        basename = PurePath(name)
+        i = self._counts.get(name, 1)
+        rename = f"{basename.stem}_{i}{basename.suffix}"
+        while rename in self._names:
             i += 1
+            rename = f"{basename.stem}_{i}{basename.suffix}"
 
-        self._names.add(name)
-        return name
+        self._counts[name] = i + 1
+        self._names.add(rename)
+        return rename
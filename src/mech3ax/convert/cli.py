@@ -1,16 +1,51 @@
 import argparse
 import sys
+from importlib import import_module
+from typing import Mapping, Sequence, Tuple
 
-from .anim import anim_from_zbd_subparser, anim_to_zbd_subparser
-from .gamez import gamez_from_zbd_subparser, gamez_to_zbd_subparser
-from .interp import interp_from_zbd_subparser, interp_to_zbd_subparser
-from .mechlib import mechlib_from_zbd_subparser, mechlib_to_zbd_subparser
-from .motion import motion_from_zbd_subparser, motion_to_zbd_subparser
-from .reader import reader_from_zbd_subparser, reader_to_zbd_subparser
-from .resources import messages_from_dll_subparser
-from .sounds import sounds_from_zbd_subparser, sounds_to_zbd_subparser
-from .textures import textures_from_zbd_subparser, textures_to_zbd_subparser
-from .utils import configure_debug_logging
+from .utils import configure_debug_logging, use_zlib_ng
+
+# subcommand name -> (module, subparser function). the converters are only
+# imported when needed, since importing all of them is slow
+Subparsers = Mapping[str, Tuple[str, str]]
+
+FROM_ZBD: Subparsers = {
+    "anim": ("anim", "anim_from_zbd_subparser"),
+    "gamez": ("gamez", "gamez_from_zbd_subparser"),
+    "interp": ("interp", "interp_from_zbd_subparser"),
+    "mechlib": ("mechlib", "mechlib_from_zbd_subparser"),
+    "motion": ("motion", "motion_from_zbd_subparser"),
+    "reader": ("reader", "reader_from_zbd_subparser"),
+    "messages": ("resources", "messages_from_dll_subparser"),
+    "sounds": ("sounds", "sounds_from_zbd_subparser"),
+    "textures": ("textures", "textures_from_zbd_subparser"),
+}
+
+TO_ZBD: Subparsers = {
+    "anim": ("anim", "anim_to_zbd_subparser"),
+    "gamez": ("gamez", "gamez_to_zbd_subparser"),
+    "interp": ("interp", "interp_to_zbd_subparser"),
+    "mechlib": ("mechlib", "mechlib_to_zbd_subparser"),
+    "motion": ("motion", "motion_to_zbd_subparser"),
+    "reader": ("reader", "reader_to_zbd_subparser"),
+    "sounds": ("sounds", "sounds_to_zbd_subparser"),
+    "textures": ("textures", "textures_to_zbd_subparser"),
+}
+
+
+def _add_subparsers(
+    subparsers: argparse._SubParsersAction, table: Subparsers, argv: Sequence[str]
+) -> None:
+    # the main parser has no options besides help, so the first argument is the
+    # subcommand. if it isn't known (or is help), all subparsers are needed
+    if argv and argv[0] in table:
+        entries = [table[argv[0]]]
+    else:
+        entries = list(table.values())
+
+    for module_name, func_name in entries:
+        module = import_module(f".{module_name}", __package__)
+        getattr(module, func_name)(subparsers)
 
 
 def main_from_zbd() -> None:
@@ -21,17 +56,10 @@ def main_from_zbd() -> None:
 
     parser.set_defaults(command=no_command)
     subparsers = parser.add_subparsers(dest="subparser_name")
-    anim_from_zbd_subparser(subparsers)
-    gamez_from_zbd_subparser(subparsers)
-    interp_from_zbd_subparser(subparsers)
-    mechlib_from_zbd_subparser(subparsers)
-    motion_from_zbd_subparser(subparsers)
-    reader_from_zbd_subparser(subparsers)
-    messages_from_dll_subparser(subparsers)
-    sounds_from_zbd_subparser(subparsers)
-    textures_from_zbd_subparser(subparsers)
+    _add_subparsers(subparsers, FROM_ZBD, sys.argv[1:])
 
     configure_debug_logging("INFO")
+    use_zlib_ng()
 
     try:
         args = parser.parse_args()
@@ -49,14 +77,7 @@ def main_to_zbd() -> None:
 
     parser.set_defaults(command=no_command)
     subparsers = parser.add_subparsers(dest="subparser_name")
-    anim_to_zbd_subparser(subparsers)
-    gamez_to_zbd_subparser(subparsers)
-    interp_to_zbd_subparser(subparsers)
-    mechlib_to_zbd_subparser(subparsers)
-    motion_to_zbd_subparser(subparsers)
-    reader_to_zbd_subparser(subparsers)
-    sounds_to_zbd_subparser(subparsers)
-    textures_to_zbd_subparser(subparsers)
+    _add_subparsers(subparsers, TO_ZBD, sys.argv[1:])
 
     configure_debug_logging("INFO")
 
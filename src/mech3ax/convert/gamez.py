@@ -4,8 +4,11 @@ The conversion is lossless and produces a binary accurate output by default.
 """
 import logging
 from argparse import Namespace, _SubParsersAction
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Optional
+from zipfile import ZipFile
 
 from ..parse.gamez import (
     GameZ,
@@ -17,7 +20,19 @@ from ..parse.gamez import (
     read_gamez,
     write_gamez,
 )
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    COMPRESS_LEVEL,
+    WRITE_BUFFER_SIZE,
+    add_compress_level_arg,
+    add_jobs_arg,
+    dir_exists,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    read_mapped,
+    zip_writer,
+)
 
 LOG = logging.getLogger(__name__)
 TEXTURES = "textures.json"
@@ -26,40 +41,60 @@ NODES = "nodes.json"
 METADATA = "metadata.json"
 
 
-def gamez_zbd_to_zip(input_zbd: Path, output_zip: Path) -> None:
-    data = input_zbd.read_bytes()
+def _nodes_json(nodes: Nodes) -> bytes:
+    # node types are written by name, which requires pydantic's encoder
+    return nodes.json(exclude_defaults=True, indent=2).encode("utf-8")
+
+
+def gamez_zbd_to_zip(
+    input_zbd: Path,
+    output_zip: Path,
+    compresslevel: int = COMPRESS_LEVEL,
+    max_workers: Optional[int] = None,
+) -> None:
+    data = read_mapped(input_zbd)
     gamez = read_gamez(data)
     data = None  # type: ignore
 
-    # GameZ files contain a lot of data
-    with ZipFile(output_zip, "w", compression=ZIP_DEFLATED, compresslevel=9) as z:
-        z.writestr(METADATA, gamez.metadata.json(indent=2))
-        z.writestr(TEXTURES, gamez.textures.json(indent=2))
-        z.writestr(MATERIALS, gamez.materials.json(exclude_defaults=True, indent=2))
-        z.writestr(NODES, gamez.nodes.json(exclude_defaults=True, indent=2))
+    # serializing is CPU-bound and each file is independent, so it is farmed
+    # out to worker processes while the results are compressed in order
+    exclude_json = partial(model_json, exclude_defaults=True)
+    with ProcessPoolExecutor(max_workers) as executor:
+        files = [
+            (METADATA, executor.submit(model_json, gamez.metadata)),
+            (TEXTURES, executor.submit(model_json, gamez.textures)),
+            (MATERIALS, executor.submit(exclude_json, gamez.materials)),
+            (NODES, executor.submit(_nodes_json, gamez.nodes)),
+        ]
+        meshes = executor.map(exclude_json, gamez.meshes, chunksize=16)
+
+        # GameZ files contain a lot of data
+        with zip_writer(output_zip, compresslevel) as z:
+            for name, future in files:
+                z.writestr(name, future.result())
 
-        for i, mesh in enumerate(gamez.meshes):
-            z.writestr(f"mesh_{i:04d}.json", mesh.json(exclude_defaults=True, indent=2))
+            for i, mesh in enumerate(meshes):
+                z.writestr(f"mesh_{i:04d}.json", mesh)
 
 
 def gamez_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
     with ZipFile(input_zip, "r") as z:
         with z.open(METADATA, "r") as ft:
-            metadata = GameZMetadata.parse_raw(ft.read())
+            metadata = model_parse(GameZMetadata, ft.read())
 
         with z.open(TEXTURES, "r") as ft:
-            textures = Textures.parse_raw(ft.read())
+            textures = model_parse(Textures, ft.read())
 
         with z.open(MATERIALS, "r") as ft:
-            materials = Materials.parse_raw(ft.read())
+            materials = model_parse(Materials, ft.read())
 
         with z.open(NODES, "r") as ft:
-            nodes = Nodes.parse_raw(ft.read())
+            nodes = model_parse(Nodes, ft.read())
 
         meshes = []
         for i in range(metadata.mesh_count):
             with z.open(f"mesh_{i:04d}.json", "r") as ft:
-                mesh = Mesh.parse_raw(ft.read())
+                mesh = model_parse(Mesh, ft.read())
             meshes.append(mesh)
 
     gamez = GameZ(
@@ -70,13 +105,13 @@ def gamez_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
         metadata=metadata,
     )
 
-    with output_zbd.open("wb") as fb:
+    with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as fb:
         write_gamez(fb, gamez)
 
 
 def gamez_from_zbd_command(args: Namespace) -> None:
     output_zip = output_resolve(args.input_zbd, args.output_zip, ".zip")
-    gamez_zbd_to_zip(args.input_zbd, output_zip)
+    gamez_zbd_to_zip(args.input_zbd, output_zip, args.compress_level, args.jobs)
 
 
 def gamez_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
@@ -84,6 +119,8 @@ def gamez_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
     parser.set_defaults(command=gamez_from_zbd_command)
     parser.add_argument("input_zbd", type=path_exists)
     parser.add_argument("output_zip", type=dir_exists, default=None, nargs="?")
+    add_compress_level_arg(parser)
+    add_jobs_arg(parser)
 
 
 def gamez_to_zbd_command(args: Namespace) -> None:
@@ -9,7 +9,15 @@ from typing import List
 from pydantic import BaseModel
 
 from ..parse.interp import Script, read_interp, write_interp
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    WRITE_BUFFER_SIZE,
+    dir_exists,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    read_mapped,
+)
 
 
 class Scripts(BaseModel):
@@ -17,18 +25,16 @@ class Scripts(BaseModel):
 
 
 def interp_zbd_to_json(input_zbd: Path, output_json: Path) -> None:
-    data = input_zbd.read_bytes()
+    data = read_mapped(input_zbd)
     scripts = Scripts(__root__=list(read_interp(data)))
 
-    with output_json.open("w", encoding="utf-8") as f:
-        f.write(scripts.json(indent=2))
+    output_json.write_bytes(model_json(scripts))
 
 
 def interp_json_to_zbd(input_json: Path, output_zbd: Path) -> None:
-    with input_json.open("r", encoding="utf-8") as ft:
-        scripts = Scripts.parse_raw(ft.read())
+    scripts = model_parse(Scripts, input_json.read_bytes())
 
-    with output_zbd.open("wb") as fb:
+    with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as fb:
         write_interp(fb, scripts.__root__)
 
 
@@ -4,10 +4,11 @@ The conversion is lossless and produces a binary accurate output by default.
 """
 import logging
 from argparse import Namespace, _SubParsersAction
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import List
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Callable, Iterator, List, Optional, Tuple
+from zipfile import ZipFile
 
 from pydantic import BaseModel
 
@@ -25,7 +26,21 @@ from ..parse.mechlib import (
     write_model,
 )
 from .archive import MANIFEST, ArchiveInfo, ArchiveManifest, Renamer
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    COMPRESS_LEVEL,
+    WRITE_BUFFER_SIZE,
+    add_compress_level_arg,
+    add_jobs_arg,
+    dir_exists,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    prefetch_map,
+    read_mapped,
+    write_converted,
+    zip_writer,
+)
 
 MATERIALS = "materials.json"
 LOG = logging.getLogger(__name__)
@@ -35,44 +50,59 @@ class Materials(BaseModel):
     __root__: List[Material]
 
 
-def mechlib_read(z: ZipFile, entry: ArchiveEntry, renamer: Renamer) -> ArchiveInfo:
-    if entry.name == "version":
-        read_version(entry.data)
-        z.writestr(entry.name, "")
-        return ArchiveInfo.from_entry(entry, entry.name)
+def mechlib_rename(name: str, renamer: Renamer) -> str:
+    if name in ("version", "format"):
+        return name
+
+    if name == "materials":
+        return MATERIALS
+
+    return renamer(name.replace(".flt", ".json"))
 
-    if entry.name == "format":
-        read_format(entry.data)
-        z.writestr(entry.name, "")
-        return ArchiveInfo.from_entry(entry, entry.name)
 
-    if entry.name == "materials":
-        materials = Materials(__root__=list(read_materials(entry.data)))
-        z.writestr(MATERIALS, materials.json(exclude_defaults=True, indent=2))
-        return ArchiveInfo.from_entry(entry, MATERIALS)
+def mechlib_read(name: str, data: bytes) -> bytes:
+    if name == "version":
+        read_version(data)
+        return b""
 
-    rename = renamer(entry.name.replace(".flt", ".json"))
-    root = read_model(entry.data)
-    z.writestr(rename, root.json(indent=2))
+    if name == "format":
+        read_format(data)
+        return b""
 
-    return ArchiveInfo.from_entry(entry, rename)
+    if name == "materials":
+        materials = Materials(__root__=list(read_materials(data)))
+        return model_json(materials, exclude_defaults=True)
 
+    root = read_model(data)
+    return model_json(root)
 
-def mechlib_zbd_to_zip(input_zbd: Path, output_zip: Path) -> None:
+
+def mechlib_zbd_to_zip(
+    input_zbd: Path,
+    output_zip: Path,
+    compresslevel: int = COMPRESS_LEVEL,
+    max_workers: Optional[int] = None,
+) -> None:
     renamer = Renamer()
 
-    # the models can get rather big...
-    with ZipFile(output_zip, "w", compression=ZIP_DEFLATED, compresslevel=9) as z:
+    with zip_writer(output_zip, compresslevel) as z:
         files = []
-
-        data = input_zbd.read_bytes()
-        for entry in read_archive(data):
-            info = mechlib_read(z, entry, renamer)
-            files.append(info)
+        data = read_mapped(input_zbd)
+
+        def jobs() -> Iterator[Tuple[str, Callable[[], bytes]]]:
+            for entry in read_archive(data):
+                rename = mechlib_rename(entry.name, renamer)
+                files.append(ArchiveInfo.from_entry(entry, rename))
+                # the memory-mapped data can't be pickled
+                yield rename, partial(mechlib_read, entry.name, bytes(entry.data))
+
+        # the models can get rather big... but they are independent, so they
+        # are converted in worker processes, and written in order
+        write_converted(z, jobs(), max_workers)
         data = None  # type: ignore
 
         manifest = ArchiveManifest(__root__=files)
-        z.writestr(MANIFEST, manifest.json(exclude_defaults=True, indent=2))
+        z.writestr(MANIFEST, model_json(manifest, exclude_defaults=True))
 
 
 def mechlib_write(z: ZipFile, info: ArchiveInfo) -> ArchiveEntry:
@@ -84,14 +114,14 @@ def mechlib_write(z: ZipFile, info: ArchiveInfo) -> ArchiveEntry:
 
     if info.name == "materials":
         with z.open(info.rename) as ft:
-            materials = Materials.parse_raw(ft.read())
+            materials = model_parse(Materials, ft.read())
 
         with BytesIO() as fb:
             write_materials(fb, materials.__root__)
             return info.to_entry(fb.getvalue())
 
     with z.open(info.rename) as ft:
-        root = Node.parse_raw(ft.read())
+        root = model_parse(Node, ft.read())
 
     with BytesIO() as fb:
         write_model(fb, root)
@@ -103,17 +133,17 @@ def mechlib_write(z: ZipFile, info: ArchiveInfo) -> ArchiveEntry:
 def mechlib_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
     with ZipFile(input_zip, "r") as z:
         with z.open(MANIFEST, "r") as ft:
-            manifest = ArchiveManifest.parse_raw(ft.read())
+            manifest = model_parse(ArchiveManifest, ft.read())
 
-        entries = iter(mechlib_write(z, info) for info in manifest.__root__)
+        entries = prefetch_map(partial(mechlib_write, z), manifest.__root__)
 
-        with output_zbd.open("wb") as fb:
+        with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as fb:
             write_archive(fb, entries)
 
 
 def mechlib_from_zbd_command(args: Namespace) -> None:
     output_zip = output_resolve(args.input_zbd, args.output_zip, ".zip")
-    mechlib_zbd_to_zip(args.input_zbd, output_zip)
+    mechlib_zbd_to_zip(args.input_zbd, output_zip, args.compress_level, args.jobs)
 
 
 def mechlib_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
@@ -121,6 +151,8 @@ def mechlib_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
     parser.set_defaults(command=mechlib_from_zbd_command)
     parser.add_argument("input_zbd", type=path_exists)
     parser.add_argument("output_zip", type=dir_exists, default=None, nargs="?")
+    add_compress_level_arg(parser)
+    add_jobs_arg(parser)
 
 
 def mechlib_to_zbd_command(args: Namespace) -> None:
@@ -2,56 +2,86 @@
 
 The conversion is lossless and produces a binary accurate output by default.
 """
-import json
 import logging
 from argparse import Namespace, _SubParsersAction
 from collections import defaultdict
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Dict
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from zipfile import ZipFile
 
 from ..parse.archive import ArchiveEntry, read_archive, write_archive
 from ..parse.motion import Motion, read_motion, write_motion
 from .archive import MANIFEST, ArchiveInfo, ArchiveManifest
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    COMPRESS_LEVEL,
+    WRITE_BUFFER_SIZE,
+    add_compress_level_arg,
+    add_jobs_arg,
+    dir_exists,
+    json_dumps,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    read_mapped,
+    write_converted,
+    zip_writer,
+)
 
 MECH_MOTIONS = "mech_motions.json"
 LOG = logging.getLogger(__name__)
 
 
-def motion_zbd_to_zip(input_zbd: Path, output_zip: Path) -> None:
-    with ZipFile(output_zip, "w", compression=ZIP_DEFLATED, compresslevel=9) as z:
+def motion_read(data: bytes) -> bytes:
+    motion = read_motion(data)
+    return model_json(motion)
+
+
+def motion_zbd_to_zip(
+    input_zbd: Path,
+    output_zip: Path,
+    compresslevel: int = COMPRESS_LEVEL,
+    max_workers: Optional[int] = None,
+) -> None:
+    with zip_writer(output_zip, compresslevel) as z:
         motions = []
         mech_motions: Dict[str, Dict[str, str]] = defaultdict(dict)
+        data = read_mapped(input_zbd)
+
+        def jobs() -> Iterator[Tuple[str, Callable[[], bytes]]]:
+            for entry in read_archive(data):
+                rename = f"{entry.name}.json"
+                motions.append(ArchiveInfo.from_entry(entry, rename))
+
+                mech_name, sep, motion_name = entry.name.partition("_")
+                if sep:
+                    mech_motions[mech_name][motion_name] = rename
 
-        data = input_zbd.read_bytes()
-        for entry in read_archive(data):
-            rename = f"{entry.name}.json"
-            motion = read_motion(entry.data)
-            z.writestr(rename, motion.json(indent=2))
-            motions.append(ArchiveInfo.from_entry(entry, rename))
+                # the memory-mapped data can't be pickled
+                yield rename, partial(motion_read, bytes(entry.data))
 
-            if "_" in entry.name:
-                mech_name, _, motion_name = entry.name.partition("_")
-                mech_motions[mech_name][motion_name] = rename
+        # the entries are independent, so they are converted in worker
+        # processes, and written in order
+        write_converted(z, jobs(), max_workers)
         data = None  # type: ignore
 
         # helper file to make loading them easier
-        z.writestr(MECH_MOTIONS, json.dumps(mech_motions, indent=2))
+        z.writestr(MECH_MOTIONS, json_dumps(mech_motions))
 
         manifest = ArchiveManifest(__root__=motions)
-        z.writestr(MANIFEST, manifest.json(exclude_defaults=True, indent=2))
+        z.writestr(MANIFEST, model_json(manifest, exclude_defaults=True))
 
 
 def motion_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
     with ZipFile(input_zip, "r") as z:
         with z.open(MANIFEST, "r") as ft:
-            manifest = ArchiveManifest.parse_raw(ft.read())
+            manifest = model_parse(ArchiveManifest, ft.read())
 
         def load_motion(info: ArchiveInfo) -> ArchiveEntry:
             with z.open(info.rename) as ft:
-                motion = Motion.parse_raw(ft.read())
+                motion = model_parse(Motion, ft.read())
 
             with BytesIO() as fb:
                 write_motion(fb, motion)
@@ -61,13 +91,13 @@ def motion_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
 
         entries = iter(load_motion(info) for info in manifest.__root__)
 
-        with output_zbd.open("wb") as fb:
+        with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as fb:
             write_archive(fb, entries)
 
 
 def motion_from_zbd_command(args: Namespace) -> None:
     output_zip = output_resolve(args.input_zbd, args.output_zip, ".zip")
-    motion_zbd_to_zip(args.input_zbd, output_zip)
+    motion_zbd_to_zip(args.input_zbd, output_zip, args.compress_level, args.jobs)
 
 
 def motion_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
@@ -75,6 +105,8 @@ def motion_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
     parser.set_defaults(command=motion_from_zbd_command)
     parser.add_argument("input_zbd", type=path_exists)
     parser.add_argument("output_zip", type=dir_exists, default=None, nargs="?")
+    add_compress_level_arg(parser)
+    add_jobs_arg(parser)
 
 
 def motion_to_zbd_command(args: Namespace) -> None:
@@ -2,48 +2,79 @@
 
 The conversion is lossless and produces a binary accurate output by default.
 """
-import json
 import logging
 from argparse import Namespace, _SubParsersAction
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Callable, Iterator, Optional, Tuple
+from zipfile import ZipFile
 
 from ..parse.archive import ArchiveEntry, read_archive, write_archive
 from ..parse.reader import read_reader, write_reader
 from .archive import MANIFEST, ArchiveInfo, ArchiveManifest, Renamer
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    COMPRESS_LEVEL,
+    WRITE_BUFFER_SIZE,
+    add_compress_level_arg,
+    add_jobs_arg,
+    dir_exists,
+    json_dumps,
+    json_loads,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    read_mapped,
+    write_converted,
+    zip_writer,
+)
 
 LOG = logging.getLogger(__name__)
 
 
-def reader_zbd_to_zip(input_zbd: Path, output_zip: Path) -> None:
+def reader_read(data: bytes) -> bytes:
+    root = read_reader(data)
+    return json_dumps(root)
+
+
+def reader_zbd_to_zip(
+    input_zbd: Path,
+    output_zip: Path,
+    compresslevel: int = COMPRESS_LEVEL,
+    max_workers: Optional[int] = None,
+) -> None:
     renamer = Renamer()
 
-    with ZipFile(output_zip, "w", compression=ZIP_DEFLATED, compresslevel=9) as z:
+    with zip_writer(output_zip, compresslevel) as z:
         readers = []
-
-        data = input_zbd.read_bytes()
-        for entry in read_archive(data):
-            name = entry.name.replace(".zrd", ".json")
-            rename = renamer(name)
-            root = read_reader(entry.data)
-            z.writestr(rename, json.dumps(root, indent=2))
-            readers.append(ArchiveInfo.from_entry(entry, rename))
+        data = read_mapped(input_zbd)
+
+        def jobs() -> Iterator[Tuple[str, Callable[[], bytes]]]:
+            for entry in read_archive(data):
+                name = entry.name.replace(".zrd", ".json")
+                rename = renamer(name)
+                readers.append(ArchiveInfo.from_entry(entry, rename))
+                # the memory-mapped data can't be pickled
+                yield rename, partial(reader_read, bytes(entry.data))
+
+        # the entries are independent, so they are converted in worker
+        # processes, and written in order
+        write_converted(z, jobs(), max_workers)
         data = None  # type: ignore
 
         manifest = ArchiveManifest(__root__=readers)
-        z.writestr(MANIFEST, manifest.json(exclude_defaults=True, indent=2))
+        z.writestr(MANIFEST, model_json(manifest, exclude_defaults=True))
 
 
 def reader_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
     with ZipFile(input_zip, "r") as z:
         with z.open(MANIFEST, "r") as ft:
-            manifest = ArchiveManifest.parse_raw(ft.read())
+            manifest = model_parse(ArchiveManifest, ft.read())
 
         def load_reader(info: ArchiveInfo) -> ArchiveEntry:
             with z.open(info.rename) as ft:
-                root = json.load(ft)
+                root = json_loads(ft.read())
 
             with BytesIO() as fb:
                 write_reader(fb, root)
@@ -53,13 +84,13 @@ def reader_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
 
         entries = iter(load_reader(info) for info in manifest.__root__)
 
-        with output_zbd.open("wb") as fb:
+        with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as fb:
             write_archive(fb, entries)
 
 
 def reader_from_zbd_command(args: Namespace) -> None:
     output_zip = output_resolve(args.input_zbd, args.output_zip, ".zip")
-    reader_zbd_to_zip(args.input_zbd, output_zip)
+    reader_zbd_to_zip(args.input_zbd, output_zip, args.compress_level, args.jobs)
 
 
 def reader_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
@@ -67,6 +98,8 @@ def reader_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
     parser.set_defaults(command=reader_from_zbd_command)
     parser.add_argument("input_zbd", type=path_exists)
     parser.add_argument("output_zip", type=dir_exists, default=None, nargs="?")
+    add_compress_level_arg(parser)
+    add_jobs_arg(parser)
 
 
 def reader_to_zbd_command(args: Namespace) -> None:
@@ -10,7 +10,16 @@ from zipfile import ZipFile
 
 from ..parse.archive import read_archive, write_archive
 from .archive import MANIFEST, ArchiveInfo, ArchiveManifest, Renamer
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    WRITE_BUFFER_SIZE,
+    dir_exists,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    prefetch_map,
+    read_mapped,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -23,9 +32,10 @@ def sounds_zbd_to_zip(
     with ZipFile(output_zip, "w") as z:
         sounds = []
 
-        data = input_zbd.read_bytes()
+        data = read_mapped(input_zbd)
         for entry in read_archive(data):
             rename = renamer(entry.name)
+            # zipfile accepts any buffer, so the mapped data isn't copied
             z.writestr(rename, entry.data)
             sounds.append(ArchiveInfo.from_entry(entry, rename))
         end = len(data)
@@ -33,12 +43,16 @@ def sounds_zbd_to_zip(
 
         if include_loose:
             base_path = input_zbd.parent
-            for i, path in enumerate(base_path.glob("*.wav")):
+            paths = list(base_path.glob("*.wav"))
+            # the next file is read while the previous one is written. only a
+            # few are read ahead, so they aren't all held in memory
+            loose = zip(paths, prefetch_map(Path.read_bytes, paths))
+            for i, (path, sound) in enumerate(loose):
                 name = path.name
                 LOG.debug("Including loose sound file '%s'", name)
 
                 rename = renamer(name)
-                z.writestr(rename, path.read_bytes())
+                z.writestr(rename, sound)
                 info = ArchiveInfo(
                     name=path.name,
                     rename=rename,
@@ -48,17 +62,17 @@ def sounds_zbd_to_zip(
                 sounds.append(info)
 
         manifest = ArchiveManifest(__root__=sounds)
-        z.writestr(MANIFEST, manifest.json(exclude_defaults=True, indent=2))
+        z.writestr(MANIFEST, model_json(manifest, exclude_defaults=True))
 
 
 def sounds_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
     with ZipFile(input_zip, "r") as z:
         with z.open(MANIFEST, "r") as ft:
-            manifest = ArchiveManifest.parse_raw(ft.read())
+            manifest = model_parse(ArchiveManifest, ft.read())
 
         entries = iter(info.to_entry(z.read(info.rename)) for info in manifest.__root__)
 
-        with output_zbd.open("wb") as fb:
+        with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as fb:
             write_archive(fb, entries)
 
 
@@ -4,9 +4,11 @@ The conversion is lossless and produces a binary accurate output by default.
 """
 from __future__ import annotations
 
+import os
 from argparse import Namespace, _SubParsersAction
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from zipfile import ZipFile
 
 from PIL import Image
@@ -14,7 +16,17 @@ from pydantic import BaseModel
 
 from ..parse.textures import DecodedTexture, TextureFlag, read_textures, write_textures
 from ..serde import Base64
-from .utils import dir_exists, output_resolve, path_exists
+from .utils import (
+    WRITE_BUFFER_SIZE,
+    add_jobs_arg,
+    dir_exists,
+    model_json,
+    model_parse,
+    output_resolve,
+    path_exists,
+    prefetch_map,
+    read_mapped,
+)
 
 MANIFEST = "manifest.json"
 
@@ -30,22 +42,22 @@ class TextureFlagExpander(BaseModel):
     PaletteLoaded: bool = False
 
     def to_flag(self) -> TextureFlag:
-        combination = TextureFlag(0)
-        for name, value in self.dict().items():
-            # always check the flag name
-            flag = TextureFlag.__members__[name]
-            if value:
-                combination |= flag
-        return combination
+        value = 0
+        for name, flag in FLAG_FIELDS:
+            if getattr(self, name):
+                value |= flag
+        return TextureFlag(value)
 
     @classmethod
     def from_flag(cls, combination: TextureFlag) -> TextureFlagExpander:
-        return cls(
-            **{
-                name: flag(combination)
-                for name, flag in TextureFlag.__members__.items()
-            }
-        )
+        # all flags are single bits
+        return cls(**{name: bool(combination & flag) for name, flag in FLAG_FIELDS})
+
+
+# always check the flag names (once, instead of for every texture)
+FLAG_FIELDS: Tuple[Tuple[str, TextureFlag], ...] = tuple(
+    (name, TextureFlag.__members__[name]) for name in TextureFlagExpander.__fields__
+)
 
 
 class TextureInfo(BaseModel):
@@ -64,16 +76,31 @@ class TextureManifest(BaseModel):
     __root__: List[TextureInfo]
 
 
+def _encode_png(texture: DecodedTexture) -> Tuple[DecodedTexture, bytes]:
+    with BytesIO() as f:
+        texture.image.save(f, format="png")
+        return texture, f.getvalue()
+
+
 def textures_zbd_to_zip(
-    input_zbd: Path, output_zip: Path, do_stretch: bool = False
+    input_zbd: Path,
+    output_zip: Path,
+    do_stretch: bool = False,
+    max_workers: Optional[int] = None,
 ) -> None:
     with ZipFile(output_zip, "w") as z:
-        data = input_zbd.read_bytes()
+        data = read_mapped(input_zbd)
 
         textures = []
-        for texture in read_textures(data, do_stretch=do_stretch):
-            with z.open(f"{texture.name}.png", mode="w") as f:
-                texture.image.save(f, format="png")
+        # Pillow releases the GIL while compressing, so the PNGs are encoded on
+        # several threads while the next textures are decoded
+        encoded = prefetch_map(
+            _encode_png,
+            read_textures(data, do_stretch=do_stretch),
+            workers=max_workers or os.cpu_count() or 1,
+        )
+        for texture, png in encoded:
+            z.writestr(f"{texture.name}.png", png)
             info = TextureInfo(
                 name=texture.name,
                 mode=texture.image.mode,
@@ -85,13 +112,13 @@ def textures_zbd_to_zip(
             textures.append(info)
 
         manifest = TextureManifest(__root__=textures)
-        z.writestr(MANIFEST, manifest.json(exclude_defaults=True, indent=2))
+        z.writestr(MANIFEST, model_json(manifest, exclude_defaults=True))
 
 
 def textures_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
     with ZipFile(input_zip, "r") as z:
         with z.open(MANIFEST, "r") as ft:
-            manifest = TextureManifest.parse_raw(ft.read())
+            manifest = model_parse(TextureManifest, ft.read())
 
         def load_texture(info: TextureInfo) -> DecodedTexture:
             with z.open(f"{info.name}.png", mode="r") as f:
@@ -109,13 +136,13 @@ def textures_zip_to_zbd(input_zip: Path, output_zbd: Path) -> None:
 
         entries = (load_texture(info) for info in manifest.__root__)
 
-        with output_zbd.open("wb") as f:
+        with output_zbd.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
             write_textures(f, entries)
 
 
 def textures_from_zbd_command(args: Namespace) -> None:
     output_zip = output_resolve(args.input_zbd, args.output_zip, ".zip")
-    textures_zbd_to_zip(args.input_zbd, output_zip, args.do_stretch)
+    textures_zbd_to_zip(args.input_zbd, output_zip, args.do_stretch, args.jobs)
 
 
 def textures_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
@@ -131,6 +158,7 @@ def textures_from_zbd_subparser(subparsers: _SubParsersAction) -> None:
             "using the textures, but bad for re-creating the ZBD."
         ),
     )
+    add_jobs_arg(parser)
 
 
 def textures_to_zbd_command(args: Namespace) -> None:
@@ -1,12 +1,232 @@
 import json
+import os
+import zipfile
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from logging.config import dictConfig
+from math import isfinite
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from typing import Any, Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    from zlib_ng import zlib_ng
+except ImportError:  # pragma: no cover
+    HAS_ZLIB_NG = False
+else:
+    HAS_ZLIB_NG = True
+
+# zlib's default. level 9 is much slower for very little gain on JSON
+COMPRESS_LEVEL = 6
+# the writers issue many small writes, so the default 8 KiB buffer means many
+# more system calls
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+Model = TypeVar("Model", bound=BaseModel)
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def use_zlib_ng() -> None:
+    """Deflate ZIP entries using zlib-ng, if it is installed.
+
+    zipfile looks up the compressor on its zlib module global, so this affects
+    the whole process, and is opt-in. zlib-ng is a drop-in replacement which
+    produces standard DEFLATE streams, but compresses JSON several times faster
+    at the same level.
+    """
+    if HAS_ZLIB_NG:
+        setattr(zipfile, "zlib", zlib_ng)
+
+
+def zip_writer(path: Path, compresslevel: int = COMPRESS_LEVEL) -> zipfile.ZipFile:
+    """Open a ZIP file for writing.
+
+    At level 0, entries are stored instead of deflated, which is much faster
+    if the ZIP file is only an intermediate.
+    """
+    if not compresslevel:
+        return zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED)
+    return zipfile.ZipFile(
+        path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    )
+
+
+def add_compress_level_arg(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "--compress-level", type=int, choices=range(10), default=COMPRESS_LEVEL
+    )
+
+
+def _has_non_finite(obj: Any) -> bool:
+    stack: List[Any] = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _orjson_lossless(data: bytes, obj: Any) -> bool:
+    # orjson silently writes NaN and infinity as null. if there is no null in
+    # the output at all (a fast search), there can't be any non-finite values.
+    # otherwise, the values have to be checked
+    return b"null" not in data or not _has_non_finite(obj)
+
+
+def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize an object to indented, UTF-8 encoded JSON.
+
+    If installed, orjson is used, since it is much faster than the standard
+    library's pretty printing (which is implemented in Python). orjson can't
+    write NaN or infinity, so in this case the standard library is used.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        data: bytes = orjson.dumps(obj, option=option)
+        if _orjson_lossless(data, obj):
+            return data
+    return json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def json_loads(data: bytes) -> Any:
+    """Deserialize UTF-8 encoded JSON.
+
+    If installed, orjson is used. orjson rejects NaN and infinity, so in this
+    case parsing falls back to the standard library.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def model_json(model: BaseModel, exclude_defaults: bool = False) -> bytes:
+    """Serialize a model to indented, UTF-8 encoded JSON.
+
+    This avoids building an intermediate string, and uses orjson if installed.
+    The model's JSON encoders are only used for values orjson can't serialize
+    natively, so enums are always serialized by value. orjson can't write NaN
+    or infinity, so in this case pydantic is used.
+    """
+    if HAS_ORJSON:
+        obj = model.dict(exclude_defaults=exclude_defaults)
+        if model.__custom_root_type__:
+            obj = obj["__root__"]
+        encoder = cast(Callable[[Any], Any], model.__json_encoder__)
+        data: bytes = orjson.dumps(obj, default=encoder, option=orjson.OPT_INDENT_2)
+        if _orjson_lossless(data, obj):
+            return data
+    return model.json(exclude_defaults=exclude_defaults, indent=2).encode("utf-8")
+
+
+def model_parse(model: Type[Model], data: bytes) -> Model:
+    """Parse and validate a model from JSON.
+
+    The JSON is parsed with json_loads, which is faster than pydantic's
+    parse_raw.
+    """
+    return model.parse_obj(json_loads(data))
 
 
 def json_dump(path: Path, obj: Any, sort_keys: bool = False) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, sort_keys=sort_keys)
+    path.write_bytes(json_dumps(obj, sort_keys=sort_keys))
+
+
+def read_mapped(path: Path) -> memoryview:
+    """Memory-map a file for reading, instead of reading it into memory.
+
+    The returned view supports the buffer protocol and slicing, but not the
+    methods of ``bytes``. The mapping is closed once it is no longer referenced.
+    """
+    with path.open("rb") as f:
+        # mapping an empty file is an error
+        if not path.stat().st_size:
+            return memoryview(b"")
+        return memoryview(mmap(f.fileno(), 0, access=ACCESS_READ))
+
+
+def prefetch_map(
+    func: Callable[[T], R], items: Iterable[T], workers: int = 1
+) -> Iterator[R]:
+    """Lazily map a function over items, preparing a few results ahead on
+    background threads.
+
+    This overlaps preparing results with consuming them, e.g. decompressing
+    and parsing entries while the previous ones are written out. Results are
+    produced in order. Only a few items per worker are in flight at a time.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from _map_ahead(executor, func, items, 2 * workers)
+
+
+def _map_ahead(
+    executor: Executor, func: Callable[[T], R], items: Iterable[T], ahead: int
+) -> Iterator[R]:
+    pending: Deque[Future[R]] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) > ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _run_named(job: Tuple[str, Callable[[], bytes]]) -> Tuple[str, bytes]:
+    name, func = job
+    return name, func()
+
+
+def write_converted(
+    z: zipfile.ZipFile,
+    jobs: Iterable[Tuple[str, Callable[[], bytes]]],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Run conversion jobs in worker processes, and write each result to the
+    ZIP file under its name, in order.
+
+    The jobs are consumed lazily, and only a few per worker are in flight at a
+    time. Each result is written as soon as it is ready, so neither the input
+    nor the output is held in memory all at once. The jobs must be picklable,
+    e.g. a ``functools.partial`` of a module-level function.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        for name, data in _map_ahead(executor, _run_named, jobs, 2 * workers):
+            z.writestr(name, data)
 
 
 def path_exists(arg: str) -> Path:
@@ -27,6 +247,15 @@ def output_resolve(input_path: Path, output_path: Optional[Path], suffix: str) -
     return output_path
 
 
+def add_jobs_arg(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of workers to convert with (default: the number of CPUs)",
+    )
+
+
 def configure_debug_logging(verbosity: str = "DEBUG") -> None:
     dictConfig(
         {
@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, Container, Iterator, Type, TypeVar, Union
+from typing import Any, Container, Iterator, NoReturn, Type, TypeVar, Union
 
 from typing_extensions import Protocol
 
@@ -48,17 +48,17 @@ class Mech3NodeError(Mech3Error):
     """An error when writing a node."""
 
 
-def _assert_base(  # pylint: disable=too-many-arguments
-    result: bool,
+def _assert_fail(  # pylint: disable=too-many-arguments
     operator: str,
     name: str,
     expected: Any,
     actual: Any,
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
-) -> None:
-    if not result:
-        raise error_class(f"{name}: {actual!r} {operator} {expected!r} (at {location})")
+) -> NoReturn:
+    # the checks pass far more often than not, so the assert functions do the
+    # comparison themselves, and only call this to format the error
+    raise error_class(f"{name}: {actual!r} {operator} {expected!r} (at {location})")
 
 
 def assert_eq(
@@ -68,8 +68,9 @@ def assert_eq(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual == expected
-    _assert_base(result, "==", name, expected, actual, location, error_class)
+    if actual == expected:
+        return
+    _assert_fail("==", name, expected, actual, location, error_class)
 
 
 def assert_ne(
@@ -79,8 +80,9 @@ def assert_ne(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual != expected
-    _assert_base(result, "!=", name, expected, actual, location, error_class)
+    if actual != expected:
+        return
+    _assert_fail("!=", name, expected, actual, location, error_class)
 
 
 def assert_lt(
@@ -90,8 +92,9 @@ def assert_lt(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual < expected
-    _assert_base(result, "<", name, expected, actual, location, error_class)
+    if actual < expected:
+        return
+    _assert_fail("<", name, expected, actual, location, error_class)
 
 
 def assert_le(
@@ -101,8 +104,9 @@ def assert_le(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual <= expected
-    _assert_base(result, "<=", name, expected, actual, location, error_class)
+    if actual <= expected:
+        return
+    _assert_fail("<=", name, expected, actual, location, error_class)
 
 
 def assert_gt(
@@ -112,8 +116,9 @@ def assert_gt(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual > expected
-    _assert_base(result, ">", name, expected, actual, location, error_class)
+    if actual > expected:
+        return
+    _assert_fail(">", name, expected, actual, location, error_class)
 
 
 def assert_ge(
@@ -123,8 +128,9 @@ def assert_ge(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual >= expected
-    _assert_base(result, ">=", name, expected, actual, location, error_class)
+    if actual >= expected:
+        return
+    _assert_fail(">=", name, expected, actual, location, error_class)
 
 
 def assert_in(
@@ -134,8 +140,9 @@ def assert_in(
     location: Union[int, str],
     error_class: Type[Mech3Error] = Mech3ParseError,
 ) -> None:
-    result = actual in expected
-    _assert_base(result, "in", name, expected, actual, location, error_class)
+    if actual in expected:
+        return
+    _assert_fail("in", name, expected, actual, location, error_class)
 
 
 def assert_between(  # pylint: disable=too-many-arguments
@@ -178,6 +185,13 @@ def assert_flag(
         raise error_class(f"{name}: 0x{actual:08X} is not valid (at {location})") from e
 
 
-def assert_all_zero(name: str, data: Union[bytes, bytearray], location: int) -> None:
-    for i, byte in enumerate(data):
-        assert_eq(f"{name} byte {i:03}", 0, byte, location + i)
+def assert_all_zero(
+    name: str, data: Union[bytes, bytearray, memoryview], location: int
+) -> None:
+    # memoryviews have no count or lstrip. this is a no-op for bytes
+    data = bytes(data)
+    # counting is done in C, so only look for the offending byte on failure
+    if data.count(0) == len(data):
+        return
+    i = len(data) - len(data.lstrip(b"\0"))
+    assert_eq(f"{name} byte {i:03}", 0, data[i], location + i)
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from mech3ax.errors import assert_ascii, assert_eq, assert_gt, assert_ne
 from mech3ax.serde import Base64
 
-from ..utils import BinReader, ascii_zterm_partition
+from ..utils import BinReader, Buffer, ascii_zterm_partition
 from .anim_def import read_anim_def, read_anim_def_zero
 from .models import AnimDef, AnimDefPointers
 
@@ -133,7 +133,7 @@ def _read_anim_defs(
     return anim_defs, anim_def_ptrs
 
 
-def read_anim(data: bytes) -> Tuple[AnimMetadata, List[AnimDef]]:
+def read_anim(data: Buffer) -> Tuple[AnimMetadata, List[AnimDef]]:
     reader = BinReader(data)
     LOG.debug("Reading animation data...")
 
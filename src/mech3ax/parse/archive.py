@@ -15,7 +15,7 @@ from struct import Struct
 from typing import BinaryIO, Iterable, Union
 
 from ..errors import Mech3ArchiveError, assert_eq
-from .utils import BinReader, ascii_zterm_padded
+from .utils import BinReader, Buffer, ascii_zterm_padded
 
 TOC_FOOTER = Struct("<2I")
 TOC_ENTRY = Struct("<2I 64s I 64s Q")
@@ -33,7 +33,7 @@ LOG = logging.getLogger(__name__)
 class ArchiveEntry:
     name: str
     start: int
-    data: bytes
+    data: Buffer
     flag: int
     comment: bytes
     write_time: Filetime
@@ -65,7 +65,7 @@ def datetime_to_filetime(timestamp: Filetime) -> int:
     return (delta // timedelta.resolution) * 10
 
 
-def read_archive(data: bytes) -> Iterable[ArchiveEntry]:
+def read_archive(data: Buffer) -> Iterable[ArchiveEntry]:
     reader = BinReader(data)
     LOG.debug("Reading archive data...")
     reader.offset = len(reader) - TOC_FOOTER.size
@@ -74,18 +74,20 @@ def read_archive(data: bytes) -> Iterable[ArchiveEntry]:
     assert_eq("archive version", VERSION, version, reader.prev, Mech3ArchiveError)
 
     # the engine reads the TOC forward
-    reader.offset = len(reader) - TOC_FOOTER.size - (TOC_ENTRY.size * count)
-
-    for i in range(count):
-        LOG.debug("Reading entry %d at %d", i, reader.offset)
-        start, length, raw_name, flag, comment, filetime = reader.read(TOC_ENTRY)
+    toc_end = len(reader) - TOC_FOOTER.size
+    toc_start = toc_end - (TOC_ENTRY.size * count)
+    # slicing the view doesn't copy the (potentially large) entry data
+    view = reader.data
+    toc = TOC_ENTRY.iter_unpack(view[toc_start:toc_end])
+
+    for i, values in enumerate(toc):
+        LOG.debug("Reading entry %d at %d", i, toc_start + TOC_ENTRY.size * i)
+        start, length, raw_name, flag, comment, filetime = values
         write_time = filetime_to_datetime(filetime)
         name = ascii_zterm_padded(raw_name)
         end = start + length
         LOG.debug("Entry '%s', data from %d to %d", name, start, end)
-        yield ArchiveEntry(
-            name, start, reader.data[start:end], flag, comment, write_time
-        )
+        yield ArchiveEntry(name, start, view[start:end], flag, comment, write_time)
 
     LOG.debug("Read archive data")
 
@@ -107,7 +109,8 @@ def write_archive(f: BinaryIO, entries: Iterable[ArchiveEntry]) -> None:
             filetime,
         )
         toc.append(entry_packed)
-        f.write(entry.data)
+        # this doesn't copy if the data is already bytes
+        f.write(bytes(entry.data))
         offset += length
 
     for i, entry_packed in enumerate(toc):
@@ -6,7 +6,7 @@ from pydantic import BaseModel
 
 from mech3ax.errors import assert_eq, assert_lt
 
-from ..utils import BinReader
+from ..utils import BinReader, Buffer
 from .materials import read_materials, size_materials, write_materials
 from .model3d import read_meshes, size_meshes, write_meshes
 from .models import GAMEZ_HEADER, Material, Mesh as Mesh, Node, NodeType, Texture
@@ -52,7 +52,7 @@ class GameZ:
     metadata: GameZMetadata
 
 
-def read_gamez(data: bytes) -> GameZ:
+def read_gamez(data: Buffer) -> GameZ:
     reader = BinReader(data)
     LOG.debug("Reading GameZ data...")
     (
@@ -18,8 +18,13 @@ from .models import (
 def _read_materials(  # pylint: disable=too-many-locals
     reader: BinReader, mat_count: int, texture_count: int
 ) -> List[Tuple[Material, int]]:
+    # the material infos are a contiguous array, so read them all at once
+    start = reader.offset
+    infos = reader.read_many(MATERIAL_INFO, mat_count)
+
     materials = []
-    for i in range(0, mat_count):
+    for i, info in enumerate(infos):
+        prev = start + i * MATERIAL_INFO.size
         # very similar to materials in the mechlib
         (
             unk00,
@@ -36,27 +41,27 @@ def _read_materials(  # pylint: disable=too-many-locals
             cycle_ptr,
             index1,
             index2,
-        ) = reader.read(MATERIAL_INFO)
+        ) = info
 
-        with assert_flag("flag", flag_raw, reader.prev + 1):
+        with assert_flag("flag", flag_raw, prev + 1):
             flag = MaterialFlag.check(flag_raw)
 
-        assert_eq("flag always", True, MaterialFlag.Always(flag), reader.prev + 1)
-        assert_eq("flag free", False, MaterialFlag.Free(flag), reader.prev + 1)
+        assert_eq("flag always", True, MaterialFlag.Always(flag), prev + 1)
+        assert_eq("flag free", False, MaterialFlag.Free(flag), prev + 1)
 
         cycled = MaterialFlag.Cycled(flag)
 
         if MaterialFlag.Textured(flag):
-            assert_eq("field 00", 255, unk00, reader.prev + 0)
+            assert_eq("field 00", 255, unk00, prev + 0)
 
             # if the material is textured, it should not have an RGB value
-            assert_eq("rgb", 0x7FFF, rgb, reader.prev + 2)
-            assert_eq("red", 255.0, red, reader.prev + 4)
-            assert_eq("green", 255.0, green, reader.prev + 8)
-            assert_eq("blue", 255.0, blue, reader.prev + 12)
+            assert_eq("rgb", 0x7FFF, rgb, prev + 2)
+            assert_eq("red", 255.0, red, prev + 4)
+            assert_eq("green", 255.0, green, prev + 8)
+            assert_eq("blue", 255.0, blue, prev + 12)
             color: Optional[Vec3] = None
             # the texture should be in range
-            assert_between("texture", 0, texture_count - 1, texture, reader.prev + 16)
+            assert_between("texture", 0, texture_count - 1, texture, prev + 16)
         else:
             # value distribution:
             #   24 0
@@ -68,23 +73,23 @@ def _read_materials(  # pylint: disable=too-many-locals
             #    1 153
             # 2629 255 (includes textured)
             values_00 = (0, 51, 76, 89, 102, 127, 153, 255)
-            assert_in("field 00", values_00, unk00, reader.prev + 0)
+            assert_in("field 00", values_00, unk00, prev + 0)
             # this is  never true for untextured materials
-            assert_eq("flag unk", False, MaterialFlag.Unknown(flag), reader.prev + 1)
+            assert_eq("flag unk", False, MaterialFlag.Unknown(flag), prev + 1)
 
             # if the material is not textured, it can't be cycled
-            assert_eq("texture cycled", False, cycled, reader.prev + 1)
+            assert_eq("texture cycled", False, cycled, prev + 1)
             # this is calculated from the floating point values, since this short
             # representation depends on the hardware RGB565 or RGB555 support
-            assert_eq("rgb", 0x0, rgb, reader.prev + 2)
+            assert_eq("rgb", 0x0, rgb, prev + 2)
             color = (red, green, blue)
-            assert_eq("texture", 0, texture, reader.prev + 16)
+            assert_eq("texture", 0, texture, prev + 16)
             texture = None
 
         # not sure what these are?
-        assert_eq("field 20", 0.0, unk20, reader.prev + 20)
-        assert_eq("field 24", 0.5, unk24, reader.prev + 24)
-        assert_eq("field 28", 0.5, unk28, reader.prev + 28)
+        assert_eq("field 20", 0.0, unk20, prev + 20)
+        assert_eq("field 24", 0.5, unk24, prev + 24)
+        assert_eq("field 28", 0.5, unk28, prev + 28)
 
         # value distribution:
         # 2480 0
@@ -108,24 +113,22 @@ def _read_materials(  # pylint: disable=too-many-locals
         # 10 0b1010
         # 12 0b1100
         # 13 0b1101
-        assert_in(
-            "field 32", (0, 1, 4, 6, 7, 8, 9, 10, 12, 13), unk32, reader.prev + 32
-        )
+        assert_in("field 32", (0, 1, 4, 6, 7, 8, 9, 10, 12, 13), unk32, prev + 32)
 
         if cycled:
-            assert_ne("cycle pointer", 0, cycle_ptr, reader.prev + 36)
+            assert_ne("cycle pointer", 0, cycle_ptr, prev + 36)
         else:
-            assert_eq("cycle pointer", 0, cycle_ptr, reader.prev + 36)
+            assert_eq("cycle pointer", 0, cycle_ptr, prev + 36)
 
         expected1 = i + 1
         if expected1 >= mat_count:
             expected1 = -1
-        assert_eq("index 1", expected1, index1, reader.prev + 40)
+        assert_eq("index 1", expected1, index1, prev + 40)
 
         expected2 = i - 1
         if expected2 < 0:
             expected2 = -1
-        assert_eq("index 2", expected2, index2, reader.prev + 42)
+        assert_eq("index 2", expected2, index2, prev + 42)
 
         material = Material(
             texture=texture,
@@ -210,7 +213,7 @@ def read_materials(reader: BinReader, texture_count: int) -> Tuple[int, List[Mat
             assert_eq("cycle count", cycle_count1, cycle_count2, reader.prev + 20)
             assert_ne("field 24", 0, data_ptr, reader.prev + 24)
 
-            cycle_textures = reader.read(Struct(f"<{cycle_count1}I"))
+            cycle_textures = reader.read_u32s(cycle_count1)
 
             for i, cycle_texture in enumerate(cycle_textures):
                 # the texture should be in range
@@ -219,7 +222,7 @@ def read_materials(reader: BinReader, texture_count: int) -> Tuple[int, List[Mat
                 )
 
             material.cycle = Cycle(
-                textures=list(cycle_textures),
+                textures=cycle_textures,
                 unk00=unk00 == 1,
                 unk04=unk04,
                 unk12=unk12,
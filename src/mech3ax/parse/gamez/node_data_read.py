@@ -254,7 +254,7 @@ def _read_partitions(  # pylint: disable=too-many-locals
 
             if count:
                 assert_ne("partition ptr", 0, ptr, reader.prev + 60)
-                nodes = [reader.read_u32() for _ in range(count)]
+                nodes = reader.read_u32s(count)
             else:
                 assert_eq("partition ptr", 0, ptr, reader.prev + 60)
                 nodes = []
@@ -168,7 +168,7 @@ def _read_node_data(reader: BinReader, node: Node) -> None:
     if node.parent_count:
         node.parent = reader.read_u32()
 
-    node.children = [reader.read_u32() for _ in range(node.children_count)]
+    node.children = reader.read_u32s(node.children_count)
 
 
 def _assert_area_partitions(world_node: Optional[Node], nodes: List[Node]) -> None:
@@ -37,24 +37,28 @@ def _ascii_zterm_suffix(buf: bytes) -> Tuple[str, str]:
 
 
 def read_textures(reader: BinReader, count: int) -> List[Texture]:
+    # the texture infos are a contiguous array, so read them all at once
+    start = reader.offset
+    infos = reader.read_many(TEXTURE_INFO, count)
+
     textures = []
-    for _ in range(count):
-        zero00, zero04, texture_raw, used, index, mone36 = reader.read(TEXTURE_INFO)
+    for i, (zero00, zero04, texture_raw, used, index, mone36) in enumerate(infos):
+        prev = start + i * TEXTURE_INFO.size
         # not sure. a pointer to the previous texture in the global array? or a
         # pointer to the texture?
-        assert_eq("field 00", 0, zero00, reader.prev + 0)
+        assert_eq("field 00", 0, zero00, prev + 0)
         # a non-zero value here causes additional dynamic code to be called
-        assert_eq("field 04", 0, zero04, reader.prev + 4)
-        with assert_ascii("texture", texture_raw, reader.prev + 8):
+        assert_eq("field 04", 0, zero04, prev + 4)
+        with assert_ascii("texture", texture_raw, prev + 8):
             texture, suffix = _ascii_zterm_suffix(texture_raw)
         # 2 if the texture is used, 0 if the texture is unused
         # 1 or 3 if the texture is being processed (deallocated?)
-        assert_eq("used", 2, used, reader.prev + 28)
+        assert_eq("used", 2, used, prev + 28)
         # stores the texture's index in the global texture array
-        assert_eq("index", 0, index, reader.prev + 32)
+        assert_eq("index", 0, index, prev + 32)
         # not sure. a pointer to the next texture in the global array? or
         # something to do with mipmaps?
-        assert_eq("field 36", -1, mone36, reader.prev + 36)
+        assert_eq("field 36", -1, mone36, prev + 36)
         textures.append(Texture(name=texture, suffix=suffix))
 
     return textures
@@ -7,7 +7,7 @@ from typing import BinaryIO, Iterable, Sequence
 from pydantic import BaseModel
 
 from ..errors import Mech3ParseError, assert_eq
-from .utils import UINT32, BinReader, ascii_zterm_padded
+from .utils import UINT32, BinReader, Buffer, ascii_zterm_padded
 
 INTERP_HEADER = Struct("<3I")
 INTERP_ENTRY = Struct("<120s 2I")
@@ -34,18 +34,19 @@ def _read_script_lines(reader: BinReader) -> Sequence[str]:
             break
 
         arg_count = reader.read_u32()
-        command = reader.read_bytes(size).decode("ascii")
+        command = str(reader.read_bytes(size), "ascii")
 
         assert_eq("argument count", arg_count, command.count("\0"), reader.prev)
         assert_eq("command end", "\0", command[-1], reader.offset - 1)
         if " " in command:  # pragma: no cover
             raise Mech3ParseError(f"command contains spaces (at {reader.prev})")
-        lines.append(command.rstrip("\0").replace("\0", " "))
+        # the trailing null was checked, so slice it off instead of stripping
+        lines.append(command[:-1].replace("\0", " "))
 
     return lines
 
 
-def read_interp(data: bytes) -> Iterable[Script]:
+def read_interp(data: Buffer) -> Iterable[Script]:
     reader = BinReader(data)
     LOG.debug("Reading interpreter data...")
     signature, version, count = reader.read(INTERP_HEADER)
@@ -55,10 +56,10 @@ def read_interp(data: bytes) -> Iterable[Script]:
     assert_eq("signature", SIGNATURE, signature, reader.prev + 0)
     assert_eq("version", VERSION, version, reader.prev + 4)
 
+    # the entries are a contiguous table, so read them all at once
+    LOG.debug("Reading %d entries at %d", count, reader.offset)
     script_info = []
-    for i in range(count):
-        LOG.debug("Reading entry %d at %d", i, reader.offset)
-        raw_name, last_modified, start = reader.read(INTERP_ENTRY)
+    for raw_name, last_modified, start in reader.read_many(INTERP_ENTRY, count):
         name = ascii_zterm_padded(raw_name)
         timestamp = datetime.fromtimestamp(last_modified, timezone.utc)
         script_info.append((name, timestamp, start))
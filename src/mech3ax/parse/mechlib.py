@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from struct import Struct
-from typing import BinaryIO, Iterable, List, Optional, Sequence
+from typing import BinaryIO, Iterable, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
 
@@ -165,7 +165,9 @@ def write_materials(f: BinaryIO, materials: Sequence[Material]) -> None:
     LOG.debug("Wrote materials data")
 
 
-def _read_node(reader: BinReader) -> Node:  # pylint: disable=too-many-locals
+def _read_node(  # pylint: disable=too-many-locals
+    reader: BinReader,
+) -> Tuple[Node, int]:
     LOG.debug("Reading node at %d...", reader.offset)
 
     is_child = reader.offset != 0
@@ -237,28 +239,40 @@ def _read_node(reader: BinReader) -> Node:  # pylint: disable=too-many-locals
         mesh = read_mesh_data(reader, wrapped_mesh)
         LOG.debug("Read mesh")
 
-    children = [_read_node(reader) for _ in range(child_count)]
-
     LOG.debug("Read node")
 
-    return Node(
+    node = Node(
         name=ascii_zterm_node_name(part_name),
         bitfield=bitfield_lower,
         object3d=object3d,
         mesh=mesh,
-        children=children,
+        children=[],
         unknown=unknown,
         node_ptr=node_ptr,
         model_ptr=model_ptr,
         parent_ptr=parent_ptr,
         child_ptr=child_ptr,
     )
+    return node, child_count
 
 
 def read_model(data: bytes) -> Node:
     reader = BinReader(data)
     LOG.debug("Reading model...")
-    root = _read_node(reader)
+    root, child_count = _read_node(reader)
+
+    # the nodes are stored depth-first, so the children are read using a stack
+    # of parents and their outstanding child counts, instead of recursion
+    stack = [(root, child_count)]
+    while stack:
+        parent, remaining = stack.pop()
+        if not remaining:
+            continue
+        stack.append((parent, remaining - 1))
+        node, child_count = _read_node(reader)
+        parent.children.append(node)
+        stack.append((node, child_count))
+
     assert_eq("model end", len(data), reader.offset, reader.offset)
     LOG.debug("Read model")
     return root
@@ -29,14 +29,14 @@ class MeshWrapper:
 def _read_vec3s(reader: BinReader, count: int) -> List[Vec3]:
     if not count:
         return []
-    return [cast(Vec3, reader.read(VEC3)) for _ in range(count)]
+    return cast(List[Vec3], reader.read_many(VEC3, count))
 
 
 def _read_lights(  # pylint: disable=too-many-locals
     reader: BinReader, count: int
 ) -> List[Light]:
     lights_and_counts = []
-    for _ in range(count):
+    for values in reader.read_many(LIGHT, count):
         (
             unk00,  # 00
             unk04,  # 04
@@ -57,7 +57,7 @@ def _read_lights(  # pylint: disable=too-many-locals
             unk64,  # 64
             unk68,  # 68
             unk72,  # 72
-        ) = reader.read(LIGHT)
+        ) = values
 
         light = Light(
             unk00=unk00,
@@ -82,12 +82,10 @@ def _read_lights(  # pylint: disable=too-many-locals
         )
         lights_and_counts.append((light, extra_count))
 
-    lights = []
     for light, extra_count in lights_and_counts:
         light.extra = _read_vec3s(reader, extra_count)
-        lights.append(light)
 
-    return lights
+    return [light for light, _ in lights_and_counts]
 
 
 def _read_polygons(  # pylint: disable=too-many-locals
@@ -96,9 +94,18 @@ def _read_polygons(  # pylint: disable=too-many-locals
     # too spammy
     # LOG.debug("Reading polygons...")
 
-    poly_info = []
-    for _ in range(count):
-        # LOG.debug("Reading polygon info %d at %d", i, reader.offset)
+    # the polygon headers are a contiguous array, followed by the polygon data.
+    # so read all headers at once, and then the data for each header in turn
+    start = reader.offset
+    headers = reader.read_many(POLYGON, count)
+
+    # bind the methods once, instead of looking them up for every polygon
+    read_u32s = reader.read_u32s
+    read_many = reader.read_many
+    construct = Polygon.construct
+
+    polygons: List[Polygon] = []
+    for i, header in enumerate(headers):
         (
             vertex_info,
             unk04,
@@ -109,30 +116,46 @@ def _read_polygons(  # pylint: disable=too-many-locals
             unk_ptr,
             texture_index,
             texture_info,
-        ) = reader.read(POLYGON)
-
-        assert_lt("vertex info", 0x3FF, vertex_info, reader.prev + 0)
-        assert_between("field 4", 0, 20, unk04, reader.prev + 4)
+        ) = header
+        prev = start + i * POLYGON.size
+        assert_lt("vertex info", 0x3FF, vertex_info, prev + 0)
+        assert_between("field 4", 0, 20, unk04, prev + 4)
 
         unk_bit = (vertex_info & 0x100) != 0
         vtx_bit = (vertex_info & 0x200) != 0
         verts_in_poly = vertex_info & 0xFF
 
-        assert_gt("verts in poly", 0, verts_in_poly, reader.prev + 0)
-        assert_ne("vertex ptr", 0, vertex_ptr, reader.prev + 8)
+        assert_gt("verts in poly", 0, verts_in_poly, prev + 0)
+        assert_ne("vertex ptr", 0, vertex_ptr, prev + 8)
 
         has_normals = vtx_bit and (normal_ptr != 0)
         has_uvs = uv_ptr != 0
 
-        assert_ne("color ptr", 0, color_ptr, reader.prev + 20)
-        assert_ne("unknown ptr", 0, unk_ptr, reader.prev + 24)
-        # assert_eq("texture info", 0xFFFF0101, texture_info, reader.prev + 32)
+        assert_ne("color ptr", 0, color_ptr, prev + 20)
+        assert_ne("unknown ptr", 0, unk_ptr, prev + 24)
+        # assert_eq("texture info", 0xFFFF0101, texture_info, prev + 32)
 
-        polygon = Polygon(
-            vertex_indices=[],
-            normal_indices=[],
-            uv_coords=[],
-            vertex_colors=[],
+        # LOG.debug("Reading polygon data %d at %d", i, reader.offset)
+        vertex_indices = read_u32s(verts_in_poly)
+
+        normal_indices: List[int] = []
+        if has_normals:
+            normal_indices = read_u32s(verts_in_poly)
+
+        uv_coords: List[Vec2] = []
+        if has_uvs:
+            uv_coords = [(u, 1.0 - v) for u, v in read_many(VEC2, verts_in_poly)]
+
+        vertex_colors = _read_vec3s(reader, verts_in_poly)
+
+        # the values come straight from the structs and are already the right
+        # types, so validating (or assigning to) the model would only slow
+        # reading down. the polygons are built once, with all fields
+        polygon = construct(
+            vertex_indices=vertex_indices,
+            normal_indices=normal_indices,
+            uv_coords=uv_coords,
+            vertex_colors=vertex_colors,
             texture_index=texture_index,
             texture_info=texture_info,
             unk04=unk04,
@@ -144,23 +167,6 @@ def _read_polygons(  # pylint: disable=too-many-locals
             color_ptr=color_ptr,
             unk_ptr=unk_ptr,
         )
-        poly_info.append((verts_in_poly, has_normals, has_uvs, polygon))
-
-    polygons: List[Polygon] = []
-    # for i, (verts_in_poly, has_normals, has_uvs, polygon) in enumerate(poly_info):
-    for verts_in_poly, has_normals, has_uvs, polygon in poly_info:
-        # LOG.debug("Reading polygon data %d at %d", i, reader.offset)
-        polygon.vertex_indices = [reader.read_u32() for _ in range(verts_in_poly)]
-
-        if has_normals:
-            polygon.normal_indices = [reader.read_u32() for _ in range(verts_in_poly)]
-
-        if has_uvs:
-            for _ in range(verts_in_poly):
-                u, v = cast(Vec2, reader.read(VEC2))
-                polygon.uv_coords.append((u, 1.0 - v))
-
-        polygon.vertex_colors = _read_vec3s(reader, verts_in_poly)
         polygons.append(polygon)
 
     # LOG.debug("Read polygons")
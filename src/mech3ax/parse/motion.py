@@ -45,9 +45,9 @@ def read_motion(data: bytes) -> Motion:
         # 8 = translation, 4 = rotation, 2 = scaling (never in motion.zbd)
         assert_eq("flag", 12, flag, reader.prev)
 
-        translations = [cast(Vec3, reader.read(VEC3)) for _ in range(frame_count)]
+        translations = cast(List[Vec3], reader.read_many(VEC3, frame_count))
         # scaling would be read here (never in motion.zbd)
-        rotations = [cast(Vec4, reader.read(VEC4)) for _ in range(frame_count)]
+        rotations = cast(List[Vec4], reader.read_many(VEC4, frame_count))
 
         # interleave translation and rotation for easy frame access
         parts[part_name] = list(zip(translations, rotations))
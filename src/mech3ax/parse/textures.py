@@ -22,7 +22,7 @@ from .colors import (
     simple_alpha565,
 )
 from .int_flag import IntFlag
-from .utils import BinReader, ascii_zterm_padded
+from .utils import BinReader, Buffer, ascii_zterm_padded
 
 TEX_HEADER = Struct("<6I")
 assert TEX_HEADER.size == 24, TEX_HEADER.size
@@ -193,7 +193,7 @@ def _read_texture(reader: BinReader, name: str, do_stretch: bool) -> DecodedText
     return DecodedTexture(name, img, flag, stretch, palette_count, palette_data)
 
 
-def read_textures(data: bytes, do_stretch: bool = True) -> Iterable[DecodedTexture]:
+def read_textures(data: Buffer, do_stretch: bool = True) -> Iterable[DecodedTexture]:
     reader = BinReader(data)
     LOG.debug("Reading texture data...")
     (zero1, has_entries, global_palette_count, count, zero2, zero3,) = reader.read(
@@ -216,12 +216,16 @@ def read_textures(data: bytes, do_stretch: bool = True) -> Iterable[DecodedTextu
     assert_eq("field 16", 0, zero2, reader.prev + 16)
     assert_eq("field 20", 0, zero3, reader.prev + 20)
 
+    # the entries are a contiguous table, so read them all at once
+    LOG.debug("Reading %d entries at %d", count, reader.offset)
+    table_start = reader.offset
+    entries = reader.read_many(TEX_ENTRY, count)
+
     table = []
-    for i in range(count):
-        LOG.debug("Reading entry %d at %d", i, reader.offset)
-        name, start, palette_index = reader.read(TEX_ENTRY)
+    for i, (name, start, palette_index) in enumerate(entries):
+        prev = table_start + i * TEX_ENTRY.size
         # global palette support isn't implemented
-        assert_eq("global palette index", -1, palette_index, reader.offset - 4)
+        assert_eq("global palette index", -1, palette_index, prev + 36)
         name = ascii_zterm_padded(name)
         table.append((name, start))
 
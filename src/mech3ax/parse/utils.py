@@ -1,5 +1,9 @@
-from struct import Struct
-from typing import Any, Tuple
+from functools import lru_cache
+from struct import Struct, error as StructError
+from typing import Any, List, Tuple, Union
+
+# data read from disk may be memory-mapped, which is exposed as a memoryview
+Buffer = Union[bytes, bytearray, memoryview]
 
 UINT32 = Struct("<I")
 
@@ -20,11 +24,18 @@ def ascii_zterm_padded(buf: bytes) -> str:
     if null_index < 0:  # pragma: no cover
         raise ValueError("Null terminator not found")
 
-    if not all(c == 0 for c in buf[null_index:]):  # pragma: no cover
+    # if everything after the terminator is null, stripping nulls from the end
+    # leaves only the string. this is much faster than checking each byte
+    if len(buf.rstrip(b"\0")) != null_index:  # pragma: no cover
         raise ValueError(f"Data after first null terminator ({buf[null_index:]!r})")
     return buf[:null_index].decode("ascii")
 
 
+@lru_cache(maxsize=None)
+def _default_node_name(length: int) -> bytes:
+    return DEFAULT_NODE_NAME.ljust(length, b"\0")
+
+
 def ascii_zterm_node_name(buf: bytes) -> str:
     """Return a string from an ASCII-encoded, zero-terminated buffer.
 
@@ -39,11 +50,9 @@ def ascii_zterm_node_name(buf: bytes) -> str:
     if null_index < 0:  # pragma: no cover
         raise ValueError("Null terminator not found")
 
-    compare = bytearray(len(buf))
-    compare[: len(DEFAULT_NODE_NAME)] = DEFAULT_NODE_NAME
-    compare[: null_index + 1] = buf[: null_index + 1]
-
-    if buf != compare:  # pragma: no cover
+    # only the data after the terminator needs to be compared
+    start = null_index + 1
+    if buf[start:] != _default_node_name(len(buf))[start:]:  # pragma: no cover
         raise ValueError(f"Data after first null terminator ({buf[null_index:]!r})")
     return buf[:null_index].decode("ascii")
 
@@ -75,9 +84,16 @@ def pack_node_name(name: str, length: int) -> bytes:
     return bytes(pack)
 
 
+@lru_cache(maxsize=None)
+def _uint32s(count: int) -> Struct:
+    return Struct(f"<{count}I")
+
+
 class BinReader:
-    def __init__(self, data: bytes):
-        self.data = data
+    def __init__(self, data: Buffer):
+        # a view means slicing never copies the data, whether it was read into
+        # memory or is memory-mapped
+        self.data = memoryview(data)
         self.offset = 0
         self.prev = 0
 
@@ -90,18 +106,41 @@ class BinReader:
         self.offset += struct.size
         return values
 
+    def read_many(self, struct: Struct, count: int) -> List[Tuple[Any, ...]]:
+        # one C-level loop over the whole array, instead of one call per item
+        end = self.offset + struct.size * count
+        # slicing a view past the end truncates, so iter_unpack would silently
+        # return fewer items
+        if end > len(self.data):
+            raise StructError(
+                f"read_many requires a buffer of at least {end} bytes for "
+                f"unpacking {end - self.offset} bytes at offset {self.offset} "
+                f"(actual buffer size is {len(self.data)})"
+            )
+        values = list(struct.iter_unpack(self.data[self.offset : end]))
+        self.prev = self.offset
+        self.offset = end
+        return values
+
     def read_u32(self) -> int:
         (value,) = UINT32.unpack_from(self.data, self.offset)
         self.prev = self.offset
         self.offset += UINT32.size
         return value  # type: ignore
 
+    def read_u32s(self, count: int) -> List[int]:
+        # one unpack for the whole array, with the struct cached by count
+        return list(self.read(_uint32s(count)))
+
     def read_bytes(self, length: int) -> bytes:
         self.prev = self.offset
         self.offset += length
-        value = self.data[self.prev : self.offset]
-        return value
+        # only copy the data out of the view here, at the boundary
+        return self.data[self.prev : self.offset].tobytes()
 
     def read_string(self) -> str:
         length = self.read_u32()
-        return self.read_bytes(length).decode("ascii")
+        self.prev = self.offset
+        self.offset += length
+        # decode straight from the view, instead of copying the bytes first
+        return str(self.data[self.prev : self.offset], "ascii")
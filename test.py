@@ -1,7 +1,9 @@
 import filecmp
 from argparse import ArgumentParser
+from functools import partial
 from logging.config import dictConfig
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 from mech3ax.convert.anim import anim_zbd_to_zip
 from mech3ax.convert.gamez import gamez_zbd_to_zip, gamez_zip_to_zbd
@@ -12,6 +14,7 @@ from mech3ax.convert.reader import reader_zbd_to_zip, reader_zip_to_zbd
 from mech3ax.convert.resources import messages_dll_to_json
 from mech3ax.convert.sounds import sounds_zbd_to_zip, sounds_zip_to_zbd
 from mech3ax.convert.textures import textures_zbd_to_zip, textures_zip_to_zbd
+from mech3ax.convert.utils import add_jobs_arg, use_zlib_ng
 from mech3ax.parse.resources import LocaleID
 
 
@@ -20,9 +23,26 @@ def compare(one: Path, two: Path) -> None:
         print("*** MISMATCH ***", one, two)
 
 
+Convert = Callable[[Path, Path], None]
+# name, mission, input_zbd, zip_path, output_zbd
+Job = Tuple[str, str, Path, Path, Path]
+
+
+def roundtrip_all(to_zip: Convert, to_zbd: Convert, jobs: List[Job]) -> None:
+    # the converters already use all CPUs, so the files are converted in turn
+    for name, mission, input_zbd, zip_path, output_zbd in jobs:
+        print(name, mission, input_zbd.name)
+        to_zip(input_zbd, zip_path)
+        to_zbd(zip_path, output_zbd)
+        compare(input_zbd, output_zbd)
+
+
 class Tester:
-    def __init__(self, base_path: Path, output_base: Path):
+    def __init__(
+        self, base_path: Path, output_base: Path, max_workers: Optional[int] = None
+    ):
         self.base_path = base_path
+        self.max_workers = max_workers
         output_base.mkdir(exist_ok=True)
 
         self.versions = sorted(
@@ -81,6 +101,7 @@ class Tester:
 
     def test_textures(self) -> None:
         print("--- TEXTURES ---")
+        jobs = []
         for name, zbd_dir, output_base in self.versions:
             output_dir = output_base / "textures"
             output_dir.mkdir(exist_ok=True)
@@ -98,13 +119,14 @@ class Tester:
 
                 zip_path = output_dir / zip_name
                 output_zbd = output_dir / zbd_name
-                print(name, mission, input_zbd.name)
-                textures_zbd_to_zip(input_zbd, zip_path)
-                textures_zip_to_zbd(zip_path, output_zbd)
-                compare(input_zbd, output_zbd)
+                jobs.append((name, mission, input_zbd, zip_path, output_zbd))
+
+        to_zip = partial(textures_zbd_to_zip, max_workers=self.max_workers)
+        roundtrip_all(to_zip, textures_zip_to_zbd, jobs)
 
     def test_reader(self) -> None:
         print("--- READER ---")
+        jobs = []
         for name, zbd_dir, output_base in self.versions:
             output_dir = output_base / "reader"
             output_dir.mkdir(exist_ok=True)
@@ -121,10 +143,10 @@ class Tester:
 
                 zip_path = output_dir / zip_name
                 output_zbd = output_dir / zbd_name
-                print(name, mission, input_zbd.name)
-                reader_zbd_to_zip(input_zbd, zip_path)
-                reader_zip_to_zbd(zip_path, output_zbd)
-                compare(input_zbd, output_zbd)
+                jobs.append((name, mission, input_zbd, zip_path, output_zbd))
+
+        to_zip = partial(reader_zbd_to_zip, max_workers=self.max_workers)
+        roundtrip_all(to_zip, reader_zip_to_zbd, jobs)
 
     def test_mechlib(self) -> None:
         print("--- MECHLIB ---")
@@ -133,7 +155,7 @@ class Tester:
             input_zbd = zbd_dir / "mechlib.zbd"
             zip_path = output_base / "mechlib.zip"
             output_zbd = output_base / "mechlib.zbd"
-            mechlib_zbd_to_zip(input_zbd, zip_path)
+            mechlib_zbd_to_zip(input_zbd, zip_path, max_workers=self.max_workers)
             mechlib_zip_to_zbd(zip_path, output_zbd)
             compare(input_zbd, output_zbd)
 
@@ -144,7 +166,7 @@ class Tester:
             input_zbd = zbd_dir / "motion.zbd"
             zip_path = output_base / "motion.zip"
             output_zbd = output_base / "motion.zbd"
-            motion_zbd_to_zip(input_zbd, zip_path)
+            motion_zbd_to_zip(input_zbd, zip_path, max_workers=self.max_workers)
             motion_zip_to_zbd(zip_path, output_zbd)
             compare(input_zbd, output_zbd)
 
@@ -169,6 +191,7 @@ class Tester:
 
     def test_gamez(self) -> None:
         print("--- GAMEZ ---")
+        jobs = []
         for name, zbd_dir, output_base in self.versions:
             # if name != "v1.0-us-pre":
             #     continue
@@ -184,10 +207,10 @@ class Tester:
 
                 zip_path = output_dir / zip_name
                 output_zbd = output_dir / zbd_name
-                print(name, mission, input_zbd.name)
-                gamez_zbd_to_zip(input_zbd, zip_path)
-                gamez_zip_to_zbd(zip_path, output_zbd)
-                compare(input_zbd, output_zbd)
+                jobs.append((name, mission, input_zbd, zip_path, output_zbd))
+
+        to_zip = partial(gamez_zbd_to_zip, max_workers=self.max_workers)
+        roundtrip_all(to_zip, gamez_zip_to_zbd, jobs)
 
 
 def configure_logging() -> None:
@@ -240,12 +263,14 @@ def main():
         "output_dir", type=lambda value: Path(value).resolve(strict=True)
     )
     parser.add_argument("--verbose", action="store_true")
+    add_jobs_arg(parser)
     args = parser.parse_args()
 
     if args.verbose:
         configure_logging()
+    use_zlib_ng()
 
-    tester = Tester(args.versions_dir, args.output_dir)
+    tester = Tester(args.versions_dir, args.output_dir, args.jobs)
     # tester.test_sounds()
     # tester.test_interp()
     # tester.test_resources()
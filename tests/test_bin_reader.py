@@ -0,0 +1,32 @@
+import unittest
+from struct import Struct, error as StructError
+
+from mech3ax.parse.utils import BinReader
+
+PAIR = Struct("<2I")
+
+
+class BinReaderReadManyTest(unittest.TestCase):
+    def test_reads_all_items(self) -> None:
+        reader = BinReader(PAIR.pack(1, 2) + PAIR.pack(3, 4))
+        self.assertEqual(reader.read_many(PAIR, 2), [(1, 2), (3, 4)])
+        self.assertEqual(reader.prev, 0)
+        self.assertEqual(reader.offset, 16)
+
+    def test_truncated_input_raises(self) -> None:
+        reader = BinReader(PAIR.pack(1, 2))
+        with self.assertRaises(StructError):
+            reader.read_many(PAIR, 3)
+        # the reader doesn't move past the end of the data
+        self.assertEqual(reader.offset, 0)
+
+    def test_truncated_memoryview_raises(self) -> None:
+        data = memoryview(PAIR.pack(1, 2) + b"\0\0\0")
+        reader = BinReader(data)
+        reader.offset = 4
+        with self.assertRaises(StructError):
+            reader.read_many(PAIR, 1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()